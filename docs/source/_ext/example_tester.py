@@ -4,7 +4,11 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import importlib.util
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, wait
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -14,6 +18,7 @@ if TYPE_CHECKING:
 
 def setup(app: Sphinx) -> dict[str, Any]:
     """Set up the extension."""
+    app.add_config_value("skip_example_tests", default=False, rebuild="env")
     app.connect("builder-inited", test_examples)
     return {
         "version": "0.1",
@@ -22,17 +27,53 @@ def setup(app: Sphinx) -> dict[str, Any]:
     }
 
 
+def run_example(example_path: str) -> None:
+    """Run a single example file.  Runs in a worker process, so a crashing example can't affect Sphinx."""
+    example_file = Path(example_path)
+    spec = importlib.util.spec_from_file_location(f"example_{example_file.stem}", example_file)
+    if spec is not None:
+        module = importlib.util.module_from_spec(spec)
+        if module is not None and spec.loader is not None:
+            with contextlib.suppress(Exception):
+                spec.loader.exec_module(module)
+
+
+def example_hash(example_file: Path) -> str:
+    """Return a digest of an example's source, used to tell whether it changed since the last build."""
+    return hashlib.blake2b(example_file.read_bytes()).hexdigest()
+
+
 def test_examples(app: Sphinx) -> None:
     """Test all example files."""
+    if app.config.skip_example_tests:
+        return
+
     examples_dir = Path(app.srcdir) / "examples"
 
     if not examples_dir.exists():
         return
 
-    for example_file in examples_dir.glob("*.py"):
-        spec = importlib.util.spec_from_file_location(f"example_{example_file.stem}", example_file)
-        if spec is not None:
-            module = importlib.util.module_from_spec(spec)
-            if module is not None and spec.loader is not None:
-                with contextlib.suppress(Exception):
-                    spec.loader.exec_module(module)
+    # Examples whose source hasn't changed since the last build were already run then.
+    hashes_path = Path(app.doctreedir) / "example_hashes.json"
+    previous_hashes: dict[str, str] = {}
+    if hashes_path.exists():
+        with contextlib.suppress(ValueError):
+            previous_hashes = json.loads(hashes_path.read_text())
+
+    # scandir reports file types from the directory listing itself, without a stat per entry
+    with os.scandir(examples_dir) as entries:
+        example_paths = [
+            Path(entry.path)
+            for entry in entries
+            if entry.is_file(follow_symlinks=False) and entry.name.endswith(".py")
+        ]
+    current_hashes = {str(example_file): example_hash(example_file) for example_file in example_paths}
+    example_files = [path for path, digest in current_hashes.items() if previous_hashes.get(path) != digest]
+
+    if example_files:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            wait([executor.submit(run_example, example_file) for example_file in example_files])
+
+    if current_hashes != previous_hashes:
+        hashes_path.parent.mkdir(parents=True, exist_ok=True)
+        hashes_path.write_text(json.dumps(current_hashes, indent=2, sort_keys=True))
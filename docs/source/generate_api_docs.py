@@ -3,34 +3,52 @@
 
 from __future__ import annotations
 
-import importlib
-import inspect
+import importlib.util
+import pkgutil
 from pathlib import Path
 
 
+def automodule_section(module_name: str, underline: str) -> str:
+    """Return the rst section documenting a single module."""
+    return (
+        f"{module_name}\n"
+        f"{underline * len(module_name)}\n\n"
+        f".. automodule:: {module_name}\n"
+        "   :members:\n"
+        "   :undoc-members:\n"
+        "   :show-inheritance:\n\n"
+    )
+
+
+def write_if_changed(output_path: Path, content: str) -> None:
+    """Write content to output_path, leaving the file (and its mtime) alone if it is already up to date."""
+    new_bytes = content.encode("utf-8")
+    if output_path.exists() and output_path.read_bytes() == new_bytes:
+        return
+
+    # Write beside the target and swap it in, so a parallel build never reads a half-written file
+    tmp_path = output_path.with_suffix(f"{output_path.suffix}.tmp")
+    tmp_path.write_bytes(new_bytes)
+    tmp_path.replace(output_path)
+
+
 def generate_api_docs(module_name: str, output_dir: str) -> None:
     """Generate API documentation for module."""
-    module = importlib.import_module(module_name)
+    # Only locate the package; ``automodule`` does the actual importing inside Sphinx.
+    spec = importlib.util.find_spec(module_name)
+    search_locations = (spec.submodule_search_locations if spec is not None else None) or []
     output_path = Path(output_dir) / f"{module_name}.rst"
 
-    with Path(output_path).open("w") as f:
-        f.write(f"{module_name}\n")
-        f.write("=" * len(module_name) + "\n\n")
-        f.write(f".. automodule:: {module_name}\n")
-        f.write("   :members:\n")
-        f.write("   :undoc-members:\n")
-        f.write("   :show-inheritance:\n\n")
-
-        # Get all submodules
-        for _name, obj in inspect.getmembers(module):
-            if inspect.ismodule(obj) and obj.__name__.startswith(module_name):
-                submodule_name = obj.__name__
-                f.write(f"{submodule_name}\n")
-                f.write("-" * len(submodule_name) + "\n\n")
-                f.write(f".. automodule:: {submodule_name}\n")
-                f.write("   :members:\n")
-                f.write("   :undoc-members:\n")
-                f.write("   :show-inheritance:\n\n")
+    parts = [automodule_section(module_name, "=")]
+
+    # Get all submodules
+    parts.extend(
+        automodule_section(mod_info.name, "-")
+        for mod_info in pkgutil.walk_packages(search_locations, prefix=f"{module_name}.")
+    )
+
+    # Sphinx re-reads sources by mtime, so only touch the file when its content changes.
+    write_if_changed(output_path, "".join(parts))
 
 
 if __name__ == "__main__":
@@ -2,83 +2,160 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import nox
 
 # Configure nox to use Poetry for dependency management
+# Quick checks come first so lint and type failures are reported before the slower test and docs runs
 nox.options.sessions = [
-    "tests",
-    "mypy",
     "lint",
-    "coverage",
-    "deduplicate_tests",
-    "docs",
-    "pre_commit",
-    "setup_hooks",
+    "mypy",
     "security",
     "dependencies_scan",
-    "dependencies_scan",
+    "pre_commit",
+    "setup_hooks",
+    "docs",
     "doctest",
     "doc_coverage",
     "doc_linkcheck",
+    "deduplicate_tests",
+    "coverage",
+    "tests",
 ]
 
+nox.options.reuse_existing_virtualenvs = True
+
 # Check if we're running on NixOS
 is_nixos = Path("/etc/nixos").exists()
 
 versions = ["3.11", "3.12", "3.13"]
 
+# Let Sphinx read and write pages on every available core
+sphinx_parallel = ("-j", "auto")
+
+# Independent checks that parallel_checks runs side by side
+parallel_targets = ["lint", "mypy", "security", "doc_linkcheck"]
+
+docs_build_dir = "docs/build"
+# Shared by every builder so pages read by one docs session are reused by the others
+docs_doctrees = f"{docs_build_dir}/.doctrees"
+# Profiles that conf.py builds with fewer extensions (see skipped_extensions there).  Sphinx discards a
+# doctree cache made with different extensions, so each of these keeps its own.
+trimmed_profiles = {"linkcheck", "fast"}
+# Flags the docs sessions read from posargs; other sessions must not pass them on to their tools
+docs_flags = {"--clean", "--fast"}
+
+
+def sphinx_build(
+    session: nox.Session, builder: str, output_dir: str, *options: str, profile: str | None = None
+) -> None:
+    """Run sphinx-build against its profile's doctree cache, wiping the build tree first on `--clean`."""
+    if "--clean" in session.posargs:
+        shutil.rmtree(docs_build_dir, ignore_errors=True)
+    sphinx_profile = profile or builder
+    doctrees = f"{docs_doctrees}-{sphinx_profile}" if sphinx_profile in trimmed_profiles else docs_doctrees
+    session.run(
+        venv_tool(session, "sphinx-build"),
+        *sphinx_parallel,
+        *options,
+        "-d",
+        doctrees,
+        "-b",
+        builder,
+        "docs/source",
+        output_dir,
+        external=True,
+        # conf.py reads this to leave out extensions the build doesn't need
+        env={"SPHINX_BUILDER": sphinx_profile},
+    )
+
+
+# Poetry environment directories, keyed by Python version
+venv_paths: dict[str, Path] = {}
+
+
+def venv_path(session: nox.Session) -> Path:
+    """Return the root of the session's Poetry environment, asking Poetry only once per Python version."""
+    python = str(session.python)
+    if python not in venv_paths:
+        path = session.run("poetry", "env", "info", "--path", external=True, silent=True)
+        venv_paths[python] = Path(str(path).strip())
+    return venv_paths[python]
+
+
+def venv_tool(session: nox.Session, tool: str) -> str:
+    """Return the path of a tool in the session's Poetry environment, to run it without `poetry run`."""
+    return str(venv_path(session) / ("Scripts" if sys.platform == "win32" else "bin") / tool)
+
+
+def poetry_install(session: nox.Session) -> None:
+    """Point Poetry at the session's Python and install the project, unless its dependencies are unchanged."""
+    session.run("poetry", "env", "use", session.python, external=True)
+
+    # One marker per dependency spec, kept inside the environment itself so that removing or recreating
+    # the environment also drops the marker and forces a fresh install
+    dependency_hash = hashlib.blake2b()
+    for path in ("pyproject.toml", "poetry.lock"):
+        dependency_hash.update(Path(path).read_bytes())
+    marker = venv_path(session) / f".nox-installed-{dependency_hash.hexdigest()}"
+    if marker.exists():
+        return
+
+    session.run("poetry", "install", external=True)
+    marker.touch()
+
 
 @nox.session(python=versions)
 def tests(session: nox.Session) -> None:
     """Run the test suite with pytest."""
-    session.run("poetry", "env", "use", session.python, external=True)
-    session.run("poetry", "install", external=True)
-    session.run("poetry", "run", "pytest", external=True)
+    poetry_install(session)
+    # Spread the tests over every core with pytest-xdist, unless specific pytest arguments were given
+    pytest_args = [arg for arg in session.posargs if arg not in docs_flags] or ["-n", "auto"]
+    session.run(venv_tool(session, "pytest"), *pytest_args, external=True)
 
 
 @nox.session(python=versions[-1])
 def mypy(session: nox.Session) -> None:
     """Run the static type checker."""
-    session.run("poetry", "env", "use", session.python, external=True)
-    session.run("poetry", "install", external=True)
-    session.run("poetry", "run", "mypy", "sfs_settings", external=True)
+    poetry_install(session)
+    session.run(venv_tool(session, "mypy"), "sfs_settings", external=True)
 
 
 @nox.session(python=versions[-1])
 def lint(session: nox.Session) -> None:
     """Run the linter."""
-    session.run("poetry", "env", "use", session.python, external=True)
-    session.run("poetry", "install", external=True)
+    poetry_install(session)
 
     # For NixOS, we need to use Python module directly instead of the binary
     if is_nixos:
         session.run("nix", "run", "nixpkgs#ruff", "--", "check", "sfs_settings", external=True)
         session.run("nix", "run", "nixpkgs#ruff", "--", "format", "--check", "sfs_settings", external=True)
     else:
-        session.run("poetry", "run", "ruff", "check", "sfs_settings", external=True)
-        session.run("poetry", "run", "ruff", "format", "--check", "sfs_settings", external=True)
+        session.run(venv_tool(session, "ruff"), "check", "sfs_settings", external=True)
+        session.run(venv_tool(session, "ruff"), "format", "--check", "sfs_settings", external=True)
 
 
 @nox.session(python=versions[-1])
 def security(session: nox.Session) -> None:
     """Run security checks."""
-    session.run("poetry", "env", "use", session.python, external=True)
-    session.run("poetry", "install", external=True)
+    poetry_install(session)
     # For comprehensive security checks beyond what ruff offers
-    session.run("poetry", "run", "bandit", "-r", "sfs_settings", external=True)
+    session.run(venv_tool(session, "bandit"), "-r", "sfs_settings", external=True)
 
 
 @nox.session(python=versions[-1])
 def coverage(session: nox.Session) -> None:
     """Run the test suite and check code coverage."""
-    session.run("poetry", "env", "use", session.python, external=True)
-    session.run("poetry", "install", external=True)
+    poetry_install(session)
     session.run(
-        "poetry",
-        "run",
-        "pytest",
+        venv_tool(session, "pytest"),
         "--cov=sfs_settings",
         "--cov-report=term-missing",
         "--cov-report=html",
@@ -90,12 +167,9 @@ def coverage(session: nox.Session) -> None:
 @nox.session(python=versions[-1])
 def deduplicate_tests(session: nox.Session) -> None:
     """Run the test suite and check code coverage."""
-    session.run("poetry", "env", "use", session.python, external=True)
-    session.run("poetry", "install", external=True)
+    poetry_install(session)
     session.run(
-        "poetry",
-        "run",
-        "pytest_deduplicate",
+        venv_tool(session, "pytest_deduplicate"),
         "--cov=sfs_settings",
         "--cov-branch",
         external=True,
@@ -105,8 +179,7 @@ def deduplicate_tests(session: nox.Session) -> None:
 @nox.session(python=versions[-1])
 def docs(session: nox.Session) -> None:
     """Build the documentation."""
-    session.run("poetry", "env", "use", session.python, external=True)
-    session.run("poetry", "install", external=True)
+    poetry_install(session)
 
     # Create all required directories (but don't populate them)
     docs_paths = ["docs/source/_static", "docs/source/_templates"]
@@ -115,67 +188,74 @@ def docs(session: nox.Session) -> None:
         Path(path).mkdir(parents=True, exist_ok=True)
 
     # Just build the docs from the files in the repo
-    session.run("poetry", "run", "sphinx-build", "-b", "html", "docs/source", "docs/build", external=True)
+    if "--fast" in session.posargs:
+        # Quick local preview: skip the heaviest extensions and don't fail on warnings
+        sphinx_build(session, "html", docs_build_dir, profile="fast")
+    else:
+        sphinx_build(session, "html", docs_build_dir, "-W", "--keep-going")
 
 
 @nox.session(python=versions[-1])
 def pre_commit(session: nox.Session) -> None:
     """Run all pre-commit hooks."""
-    session.run("poetry", "env", "use", session.python, external=True)
-    session.run("poetry", "install", external=True)  # Remove --extras dev
-    session.run("poetry", "run", "pre-commit", "run", "--all-files", external=True)
+    poetry_install(session)
+    session.run(venv_tool(session, "pre-commit"), "run", "--all-files", external=True)
 
 
 @nox.session(python=versions[-1])
 def setup_hooks(session: nox.Session) -> None:
     """Install pre-commit hooks."""
-    session.run("poetry", "env", "use", session.python, external=True)
-    session.run("poetry", "install", external=True)
-    session.run("poetry", "run", "pre-commit", "install", external=True)
+    poetry_install(session)
+    session.run(venv_tool(session, "pre-commit"), "install", external=True)
 
 
 @nox.session(python=versions[-1])
 def dependencies_scan(session: nox.Session) -> None:
     """Scan dependencies for security issues."""
-    session.run("poetry", "env", "use", session.python, external=True)
-    session.run("poetry", "install", external=True)
-    session.run("poetry", "run", "safety", "scan", "--full-report", external=True)
+    poetry_install(session)
+    session.run(venv_tool(session, "safety"), "scan", "--full-report", external=True)
 
 
 @nox.session(python=versions[-1])
 def doctest(session: nox.Session) -> None:
     """Run the doctest suite to ensure examples work."""
-    session.run("poetry", "env", "use", session.python, external=True)
-    session.run("poetry", "install", external=True)
-    session.run(
-        "poetry", "run", "sphinx-build", "-b", "doctest", "docs/source", "docs/build/doctest", external=True
-    )
+    poetry_install(session)
+    sphinx_build(session, "doctest", f"{docs_build_dir}/doctest")
 
 
 @nox.session(python=versions[-1])
 def doc_coverage(session: nox.Session) -> None:
     """Check documentation coverage."""
-    session.run("poetry", "env", "use", session.python, external=True)
-    session.run("poetry", "install", external=True)
-    session.run("poetry", "run", "coverage", "run", "--source=sfs_settings", "-m", "pytest", external=True)
-    session.run(
-        "poetry", "run", "sphinx-build", "-b", "coverage", "docs/source", "docs/build/coverage", external=True
-    )
-    session.run("poetry", "run", "cat", "docs/build/coverage/python.txt", external=True)
+    poetry_install(session)
+    session.run(venv_tool(session, "coverage"), "run", "--source=sfs_settings", "-m", "pytest", external=True)
+    sphinx_build(session, "coverage", f"{docs_build_dir}/coverage")
+    session.run("cat", f"{docs_build_dir}/coverage/python.txt", external=True)
 
 
 @nox.session(python=versions[-1])
 def doc_linkcheck(session: nox.Session) -> None:
     """Check all internal and external links in the documentation."""
-    session.run("poetry", "env", "use", session.python, external=True)
-    session.run("poetry", "install", external=True)
-    session.run(
-        "poetry",
-        "run",
-        "sphinx-build",
-        "-b",
-        "linkcheck",
-        "docs/source",
-        "docs/build/linkcheck",
-        external=True,
-    )
+    poetry_install(session)
+    sphinx_build(session, "linkcheck", f"{docs_build_dir}/linkcheck")
+
+
+def run_nox_session(name: str) -> int:
+    """Run a single nox session in its own process and return its exit code."""
+    return subprocess.run(  # noqa: S603
+        [sys.executable, "-m", "nox", "-s", name, "--no-install"], check=False
+    ).returncode
+
+
+@nox.session(python=versions[-1])
+def parallel_checks(session: nox.Session) -> None:
+    """Run the independent check sessions concurrently."""
+    # Install once up front so the sessions below find the environment ready instead of racing to build it
+    poetry_install(session)
+
+    max_workers = min(len(parallel_targets), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        exit_codes = list(executor.map(run_nox_session, parallel_targets))
+
+    failed = [name for name, exit_code in zip(parallel_targets, exit_codes, strict=True) if exit_code]
+    if failed:
+        session.error(f"Failed sessions: {', '.join(failed)}")
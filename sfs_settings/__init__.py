@@ -47,9 +47,9 @@ Use values directly:
 
 from __future__ import annotations
 
-from dotenv import load_dotenv
-
 from .core_functions import (
+    TrackSpec,
+    bulk_track,
     return_env_var,
     return_secret_var,
     set_env_var_locally,
@@ -58,10 +58,16 @@ from .core_functions import (
     track_secret_var,
 )
 from .exceptions import SettingsNotFoundError, SettingsValidationError
+from .obtainers import clear_secret_cache
+from .pseudo_variable import clear_cached_values
 
 __all__ = [
     "SettingsNotFoundError",
     "SettingsValidationError",
+    "TrackSpec",
+    "bulk_track",
+    "clear_cached_values",
+    "clear_secret_cache",
     "return_env_var",
     "return_secret_var",
     "set_env_var_locally",
@@ -72,7 +78,4 @@ __all__ = [
 
 __version__ = "0.9.4"
 
-# This loads values from a .env file into the os.environ
-load_dotenv()
-
 DEBUG_sfs_settings = False
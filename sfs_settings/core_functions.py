@@ -3,16 +3,44 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from os import environ
-from types import ModuleType
-from typing import Any
+from dataclasses import dataclass
+from functools import cache, lru_cache
+from typing import Any, Literal
 
-import keyring
-from pydantic import validate_call
+from pydantic import ConfigDict, validate_call
 
-from sfs_settings.exceptions import SettingsNotFoundError
+from sfs_settings.obtainers import EnvVarObtainer, SecretObtainer
 from sfs_settings.pseudo_variable import PseudoVariable
-from sfs_settings.utility_functions import get_calling_module, get_this_module, obtain_convert_and_validate
+from sfs_settings.utility_functions import (
+    always_valid,
+    get_calling_namespace,
+    get_this_module,
+    obtain_convert_and_validate,
+)
+
+
+@dataclass(frozen=True)
+class TrackSpec:
+    """
+    Options for one setting tracked by `bulk_track`.
+
+    Each field has the same meaning and default as the `track_env_var` parameter of the same name. Setting
+    `store_name` tracks a secret instead, as `track_secret_var` would, looked up under `name_in_store`
+    or, if that is None, under the setting's own name. Note that `reobtain_each_usage` still defaults
+    to False here, unlike in `track_secret_var`.
+    """
+
+    # Makes validate_call reject unknown keys, so a typo like "defualt" fails instead of being ignored
+    __pydantic_config__ = ConfigDict(extra="forbid")
+
+    default: str | None = None
+    validator_function: Callable[[Any], bool] = always_valid
+    reobtain_each_usage: bool = False
+    conversion_function: Callable[[str], Any] | type = str
+    ttl_seconds: float | None = None
+    store_name: str | None = None
+    name_in_store: str | None = None
+    cache: bool | int = False
 
 
 def set_in_module(
@@ -22,86 +50,98 @@ def set_in_module(
     conversion_function: Callable[[str], Any] | type,
     validator_function: Callable[[Any], bool],
     reobtain_each_usage: bool,
-    module_ref: ModuleType,
+    ttl_seconds: float | None,
+    namespace: dict[str, Any],
 ) -> None:
-    """Set a variable in a module."""
-    setattr(
-        module_ref,
-        name,
-        returnable_value(
-            obtaining_function=obtaining_function,
-            conversion_function=conversion_function,
-            validator_function=validator_function,
-            reobtain_each_usage=reobtain_each_usage,
-        ),
+    """Set a variable in a module's namespace."""
+    namespace[name] = returnable_value(
+        obtaining_function=obtaining_function,
+        conversion_function=conversion_function,
+        validator_function=validator_function,
+        reobtain_each_usage=reobtain_each_usage,
+        ttl_seconds=ttl_seconds,
     )
 
 
-@validate_call
 def returnable_value(
     *,
     obtaining_function: Callable[[], str],
     conversion_function: Callable[[str], Any] | type,
     validator_function: Callable[[Any], bool],
     reobtain_each_usage: bool,
+    ttl_seconds: float | None = None,
 ) -> Any:
     """Return a value that can be used as a variable."""
-    return (
-        PseudoVariable(
+    if reobtain_each_usage:
+        return build_pseudo_variable(
             obtaining_function=obtaining_function,
             conversion_function=conversion_function,
             validator_function=validator_function,
+            ttl_seconds=ttl_seconds,
         )
-        if reobtain_each_usage
-        else obtain_convert_and_validate(
-            obtaining_function=obtaining_function,
-            conversion_function=conversion_function,
-            is_valid_function=validator_function,
-        )
+    return materialize_value(
+        obtaining_function=obtaining_function,
+        conversion_function=conversion_function,
+        validator_function=validator_function,
     )
 
 
-@validate_call
+def materialize_value(
+    *,
+    obtaining_function: Callable[[], str],
+    conversion_function: Callable[[str], Any] | type,
+    validator_function: Callable[[Any], bool],
+) -> Any:
+    """Obtain, convert, and validate a value once, right now, and return it as a plain value."""
+    return obtain_convert_and_validate(obtaining_function, conversion_function, validator_function)
+
+
+def build_pseudo_variable(
+    *,
+    obtaining_function: Callable[[], str],
+    conversion_function: Callable[[str], Any] | type,
+    validator_function: Callable[[Any], bool],
+    ttl_seconds: float | None = None,
+) -> PseudoVariable:
+    """Return a PseudoVariable that obtains, converts, and validates the value on every use."""
+    return PseudoVariable(
+        obtaining_function=obtaining_function,
+        conversion_function=conversion_function,
+        validator_function=validator_function,
+        ttl_seconds=ttl_seconds,
+    )
+
+
+# typed, because True == 1 would otherwise make cache=True and cache=1 share whichever obtainer came first
+@lru_cache(maxsize=None, typed=True)
 def generate_obtain_secret_function(
     store_name: str,
     name_in_store: str,
     default: str | None = None,
+    cache: bool | int = False,
 ) -> Callable[[], str]:
     """Generate a function that obtains a secret from a secret store."""
-
-    @validate_call
-    def obtain_secret() -> str:
-        """Obtain the secret from the secret store."""
-        return keyring.get_password(store_name, name_in_store) or default  # type: ignore  # noqa: PGH003
-
-    return obtain_secret
+    # Obtainers hold no state, so every declaration of the same secret can share one
+    return SecretObtainer(store_name, name_in_store, default, cache)
 
 
-@validate_call
+@cache
 def generate_obtain_env_val_function(
     name: str,
     default: str | None = None,
 ) -> Callable[[], str]:
     """Generate a function that obtains an environment variable."""
+    # Obtainers hold no state, so every declaration of the same variable can share one
+    return EnvVarObtainer(name, default)
 
-    @validate_call
-    def obtaining_function() -> str:
-        """Obtain the environment variable."""
-        val = environ.get(name, default)
-        if val is None:
-            raise SettingsNotFoundError(f"Environment variable {name} is required but not set.")
-        return val
-
-    return obtaining_function
 
-
-@validate_call
 def set_var_in_calling_module(
     name: str,
     obtaining_function: Callable[[], str],
     conversion_function: Callable[[str], Any] | type,
     validator_function: Callable[[Any], bool],
     reobtain_each_usage: bool,
+    ttl_seconds: float | None,
 ) -> None:
     """Set a variable in the calling module."""
     set_in_module(
@@ -110,17 +150,18 @@ def set_var_in_calling_module(
         validator_function=validator_function,
         reobtain_each_usage=reobtain_each_usage,
         conversion_function=conversion_function,
-        module_ref=get_calling_module(),
+        ttl_seconds=ttl_seconds,
+        namespace=get_calling_namespace(),
     )
 
 
-@validate_call
 def set_var_in_sfs_settings(
     name: str,
     obtaining_function: Callable[[], str],
     conversion_function: Callable[[str], Any] | type,
     validator_function: Callable[[Any], bool],
     reobtain_each_usage: bool,
+    ttl_seconds: float | None,
 ) -> None:
     """Set a variable in the sfs_settings module."""
     set_in_module(
@@ -129,7 +170,8 @@ def set_var_in_sfs_settings(
         validator_function=validator_function,
         reobtain_each_usage=reobtain_each_usage,
         conversion_function=conversion_function,
-        module_ref=get_this_module(),
+        ttl_seconds=ttl_seconds,
+        namespace=vars(get_this_module()),
     )
 
 
@@ -137,9 +179,10 @@ def set_var_in_sfs_settings(
 def track_env_var(
     env_var_name: str,
     default: str | None = None,
-    validator_function: Callable[[Any], bool] = lambda _: True,
+    validator_function: Callable[[Any], bool] = always_valid,
     reobtain_each_usage: bool = False,
     conversion_function: Callable[[str], Any] | type = str,
+    ttl_seconds: float | None = None,
 ) -> None:
     """
     Set a variable in the calling module with the same name as the environment variable given as `name`.
@@ -157,6 +200,10 @@ def track_env_var(
         called.
     conversion_function : Callable[[str], Any] or type, Optional
         A function or type that converts the obtained value to the desired type.
+    ttl_seconds : float or None, Optional
+        Only used when reobtain_each_usage is True. If greater than zero, an obtained value is reused for
+        this many seconds before it is obtained again, so bursts of accesses share a single lookup. The
+        default of None, like 0, obtains the value on every use.
 
     Returns
     -------
@@ -170,6 +217,7 @@ def track_env_var(
         validator_function=validator_function,
         reobtain_each_usage=reobtain_each_usage,
         conversion_function=conversion_function,
+        ttl_seconds=ttl_seconds,
     )
 
 
@@ -179,9 +227,11 @@ def track_secret_var(
     store_name: str,
     name_in_store: str,
     default: str | None = None,
-    validator_function: Callable[[Any], bool] = lambda _: True,
+    validator_function: Callable[[Any], bool] = always_valid,
     reobtain_each_usage: bool = True,
     conversion_function: Callable[[str], Any] | type = str,
+    ttl_seconds: float | None = None,
+    cache: bool | int = False,
 ) -> None:
     """
     Get a secret from a secret store (and help set if missing and no default is provided).
@@ -227,6 +277,15 @@ def track_secret_var(
     conversion_function : Callable[[str], Any] or type, Optional
         An auxiliary function that converts the value from a string to the desired type.
         Use this for complex or nested types.
+    ttl_seconds : float or None, Optional
+        Only used when reobtain_each_usage is True. If greater than zero, an obtained value is reused for
+        this many seconds before it is obtained again, so bursts of accesses share a single lookup. The
+        default of None, like 0, obtains the value on every use.
+    cache : bool or int, Optional
+        If True or an int, the secret is remembered after it is first fetched and shared by every lookup
+        of it until `clear_secret_cache` is called. An int sets how many secrets the cache holds and must
+        be at least 1; True holds up to 128. Defaults to False, which asks the secret store on every
+        lookup.
 
     Returns
     -------
@@ -241,10 +300,12 @@ def track_secret_var(
             store_name=store_name,
             name_in_store=name_in_store,
             default=default,
+            cache=cache,
         ),
         validator_function=validator_function,
         reobtain_each_usage=reobtain_each_usage,
         conversion_function=conversion_function,
+        ttl_seconds=ttl_seconds,
     )
 
 
@@ -252,9 +313,10 @@ def track_secret_var(
 def set_env_var_locally(
     name: str,
     default: str | None = None,
-    validator_function: Callable[[Any], bool] = lambda _: True,
+    validator_function: Callable[[Any], bool] = always_valid,
     reobtain_each_usage: bool = False,
     conversion_function: Callable[[str], Any] | type = str,
+    ttl_seconds: float | None = None,
 ) -> None:
     """
     Set a variable in the calling module with the same name as the environment variable given as `name`.
@@ -275,6 +337,10 @@ def set_env_var_locally(
     conversion_function : Callable[[str], Any] or type, Optional
         An auxiliary function that converts the value from a string to the desired type.
         Use this for complex or nested types.
+    ttl_seconds : float or None, Optional
+        Only used when reobtain_each_usage is True. If greater than zero, an obtained value is reused for
+        this many seconds before it is obtained again, so bursts of accesses share a single lookup. The
+        default of None, like 0, obtains the value on every use.
 
     Returns
     -------
@@ -288,6 +354,7 @@ def set_env_var_locally(
         validator_function=validator_function,
         reobtain_each_usage=reobtain_each_usage,
         conversion_function=conversion_function,
+        ttl_seconds=ttl_seconds,
     )
 
 
@@ -297,9 +364,11 @@ def set_secret_var_locally(
     store_name: str,
     name_in_store: str,
     default: str | None = None,
-    validator_function: Callable[[Any], bool] = lambda _: True,
+    validator_function: Callable[[Any], bool] = always_valid,
     reobtain_each_usage: bool = True,
     conversion_function: Callable[[str], Any] | type = str,
+    ttl_seconds: float | None = None,
+    cache: bool | int = False,
 ) -> None:
     """
     Get a secret from a secret store (and help set if missing and no default is provided).
@@ -345,6 +414,15 @@ def set_secret_var_locally(
     conversion_function : Callable[[str], Any] or type, Optional
         An auxiliary function that converts the value from a string to the desired type.
         Use this for complex or nested types.
+    ttl_seconds : float or None, Optional
+        Only used when reobtain_each_usage is True. If greater than zero, an obtained value is reused for
+        this many seconds before it is obtained again, so bursts of accesses share a single lookup. The
+        default of None, like 0, obtains the value on every use.
+    cache : bool or int, Optional
+        If True or an int, the secret is remembered after it is first fetched and shared by every lookup
+        of it until `clear_secret_cache` is called. An int sets how many secrets the cache holds and must
+        be at least 1; True holds up to 128. Defaults to False, which asks the secret store on every
+        lookup.
 
     Returns
     -------
@@ -359,19 +437,23 @@ def set_secret_var_locally(
             store_name=store_name,
             name_in_store=name_in_store,
             default=default,
+            cache=cache,
         ),
         validator_function=validator_function,
         reobtain_each_usage=reobtain_each_usage,
         conversion_function=conversion_function,
+        ttl_seconds=ttl_seconds,
     )
 
 
+@validate_call
 def return_env_var(
     env_var_name: str,
     default: str | None = None,
-    validator_function: Callable[[Any], bool] = lambda _: True,
+    validator_function: Callable[[Any], bool] = always_valid,
     reobtain_each_usage: bool = False,
     conversion_function: Callable[[str], Any] | type = str,
+    ttl_seconds: float | None = None,
 ) -> Any:
     """
     Get a value from an environment variable.
@@ -391,6 +473,10 @@ def return_env_var(
     conversion_function : Callable[[str], Any] or type, Optional
         An auxiliary function that converts the value from a string to the desired type.
         Use this for complex or nested types.
+    ttl_seconds : float or None, Optional
+        Only used when reobtain_each_usage is True. If greater than zero, an obtained value is reused for
+        this many seconds before it is obtained again, so bursts of accesses share a single lookup. The
+        default of None, like 0, obtains the value on every use.
 
     Returns
     -------
@@ -403,16 +489,20 @@ def return_env_var(
         conversion_function=conversion_function,
         validator_function=validator_function,
         reobtain_each_usage=reobtain_each_usage,
+        ttl_seconds=ttl_seconds,
     )
 
 
+@validate_call
 def return_secret_var(
     store_name: str,
     name_in_store: str,
     default: str | None = None,
-    validator_function: Callable[[Any], bool] = lambda _: True,
+    validator_function: Callable[[Any], bool] = always_valid,
     reobtain_each_usage: bool = True,
     conversion_function: Callable[[str], Any] | type = str,
+    ttl_seconds: float | None = None,
+    cache: bool | int = False,
 ) -> Any:
     """
     Get a secret from a secret store (and help set if missing and no default is provided).
@@ -456,6 +546,15 @@ def return_secret_var(
     conversion_function : Callable[[str], Any] or type, Optional
         An auxiliary function that converts the value from a string to the desired type.
         Use this for complex or nested types.
+    ttl_seconds : float or None, Optional
+        Only used when reobtain_each_usage is True. If greater than zero, an obtained value is reused for
+        this many seconds before it is obtained again, so bursts of accesses share a single lookup. The
+        default of None, like 0, obtains the value on every use.
+    cache : bool or int, Optional
+        If True or an int, the secret is remembered after it is first fetched and shared by every lookup
+        of it until `clear_secret_cache` is called. An int sets how many secrets the cache holds and must
+        be at least 1; True holds up to 128. Defaults to False, which asks the secret store on every
+        lookup.
 
     Returns
     -------
@@ -468,8 +567,53 @@ def return_secret_var(
             store_name=store_name,
             name_in_store=name_in_store,
             default=default,
+            cache=cache,
         ),
         conversion_function=conversion_function,
         reobtain_each_usage=reobtain_each_usage,
         validator_function=validator_function,
+        ttl_seconds=ttl_seconds,
     )
+
+
+@validate_call
+def bulk_track(settings: dict[str, TrackSpec], *, where: Literal["self", "caller"] = "self") -> None:
+    """
+    Track several environment variables or secrets at once, as `track_env_var` or `track_secret_var` would.
+
+    The whole mapping is validated in a single pass and the target namespace is looked up once, which
+    makes this the recommended way to register many settings at startup.
+
+    Parameters
+    ----------
+    settings : dict[str, TrackSpec]
+        Maps each variable name to the options to track it with.
+    where : str, Optional
+        Either "self" or "caller". "self" sets the variables in the sfs_settings module, like
+        `track_env_var`; "caller" sets them in the calling module, like `set_env_var_locally`. Defaults
+        to "self".
+
+    Returns
+    -------
+    None
+        This function does not return anything. It sets variables in the chosen module as a side effect.
+
+    """
+    namespace = vars(get_this_module()) if where == "self" else get_calling_namespace()
+    for name, spec in settings.items():
+        obtaining_function = (
+            generate_obtain_env_val_function(name, spec.default)
+            if spec.store_name is None
+            else generate_obtain_secret_function(
+                spec.store_name, spec.name_in_store or name, spec.default, spec.cache
+            )
+        )
+        set_in_module(
+            name=name,
+            obtaining_function=obtaining_function,
+            validator_function=spec.validator_function,
+            reobtain_each_usage=spec.reobtain_each_usage,
+            conversion_function=spec.conversion_function,
+            ttl_seconds=spec.ttl_seconds,
+            namespace=namespace,
+        )
@@ -0,0 +1,97 @@
+"""Callables that obtain the raw value of a setting.  Not for public use."""
+
+from __future__ import annotations
+
+import sys
+from functools import lru_cache
+from os import environ
+from typing import TYPE_CHECKING
+
+import keyring
+
+from sfs_settings.exceptions import SettingsNotFoundError
+from sfs_settings.utility_functions import dotenv_values_once
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from functools import _lru_cache_wrapper
+
+# Cache size used when a secret is cached with cache=True rather than an explicit size.
+DEFAULT_SECRET_CACHE_SIZE = 128
+
+# One memoized fetch_secret per requested cache size, so clear_secret_cache() can reach all of them.
+_cached_fetchers: dict[int, _lru_cache_wrapper[str | None]] = {}
+
+
+def fetch_secret(store_name: str, name_in_store: str) -> str | None:
+    """Fetch a secret from the secret store."""
+    return keyring.get_password(store_name, name_in_store)
+
+
+def cached_fetcher(maxsize: int) -> Callable[[str, str], str | None]:
+    """Return a fetch_secret that remembers up to maxsize secrets, keyed by store and name."""
+    if maxsize not in _cached_fetchers:
+        _cached_fetchers[maxsize] = lru_cache(maxsize=maxsize)(fetch_secret)
+    return _cached_fetchers[maxsize]
+
+
+def clear_secret_cache() -> None:
+    """Forget every secret remembered by a cached secret lookup, e.g. after rotating a secret."""
+    for fetcher in _cached_fetchers.values():
+        fetcher.cache_clear()
+
+
+class EnvVarObtainer:
+    """Obtain the value of an environment variable, falling back to a default."""
+
+    __slots__ = ("default", "name")
+
+    def __init__(self, name: str, default: str | None = None) -> None:
+        """Initialize the obtainer."""
+        # Interned, so the many declarations of one variable share a single name string
+        self.name = sys.intern(name)
+        self.default = default
+
+    def __call__(self) -> str:
+        """Obtain the environment variable."""
+        # Deferred to here so importing sfs_settings, or only using secrets, never reads a .env file
+        dotenv_values = dotenv_values_once()
+        val = environ.get(self.name)
+        if val is None:
+            val = dotenv_values.get(self.name)
+        if val is None:
+            val = self.default
+        if val is None:
+            raise SettingsNotFoundError(f"Environment variable {self.name} is required but not set.")
+        return val
+
+
+class SecretObtainer:
+    """Obtain a secret from a secret store, falling back to a default."""
+
+    __slots__ = ("default", "fetch", "name_in_store", "store_name")
+
+    def __init__(
+        self,
+        store_name: str,
+        name_in_store: str,
+        default: str | None = None,
+        cache: bool | int = False,
+    ) -> None:
+        """Initialize the obtainer."""
+        # Interned, so the variables naming the same secret share one key for the lookup cache
+        self.store_name = sys.intern(store_name)
+        self.name_in_store = sys.intern(name_in_store)
+        self.default = default
+        if cache is False:
+            self.fetch: Callable[[str, str], str | None] = fetch_secret
+        elif cache is True:
+            self.fetch = cached_fetcher(DEFAULT_SECRET_CACHE_SIZE)
+        elif cache >= 1:
+            self.fetch = cached_fetcher(cache)
+        else:
+            raise ValueError(f"cache must be a bool or a cache size of at least 1, not {cache}.")
+
+    def __call__(self) -> str:
+        """Obtain the secret from the secret store."""
+        return self.fetch(self.store_name, self.name_in_store) or self.default  # type: ignore  # noqa: PGH003
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import math
+import operator
+import time
+from collections.abc import Callable, Iterator
+from functools import partial
 from typing import Any
+from weakref import WeakValueDictionary
 
-from pydantic import validate_call
+from sfs_settings.utility_functions import always_valid, obtain_and_convert, obtain_convert_and_validate
 
-from sfs_settings.utility_functions import obtain_convert_and_validate
+# Every live PseudoVariable, so clear_cached_values() can reach their caches.  Keyed by id() because
+# PseudoVariable hashes by its current value, which would mean obtaining it just to register it.
+_instances: WeakValueDictionary[int, PseudoVariable] = WeakValueDictionary()
 
 
 class PseudoVariable:
@@ -16,40 +23,109 @@ class PseudoVariable:
     Has imperfect security due to underlying python characteristics.  These can't be further improved.
     """
 
-    __slots__ = ("conversion_function", "obtaining_function", "validator_function")
+    __slots__ = (
+        "__weakref__",
+        "_cached_at",
+        "_cached_value",
+        "_obtain",
+        "_thunk",
+        "ttl_seconds",
+    )
 
-    @validate_call
     def __init__(
         self,
         obtaining_function: Callable[[], str],
         conversion_function: Callable[[str], Any] | type,
         validator_function: Callable[[Any], bool],
+        ttl_seconds: float | None = None,
     ) -> None:
         """Initialize the pseudo variable."""
-        self.obtaining_function = obtaining_function
-        self.conversion_function = conversion_function
-        self.validator_function = validator_function
-
-    def _get_value(self) -> Any:
-        """Get the actual value."""
-        return obtain_convert_and_validate(
-            obtaining_function=self.obtaining_function,
-            conversion_function=self.conversion_function,
-            is_valid_function=self.validator_function,
-        )
+        self.ttl_seconds = ttl_seconds or 0.0
+        self._cached_value: Any = None
+        self._cached_at = -math.inf
+        # Chosen once here so each access is a single call doing only the work this variable needs.  The
+        # default validator can't reject anything, and a str value can't be changed by converting it either.
+        self._obtain: Callable[[], Any]
+        if validator_function is not always_valid:
+            self._obtain = partial(
+                obtain_convert_and_validate, obtaining_function, conversion_function, validator_function
+            )
+        elif conversion_function is not str:
+            self._obtain = partial(obtain_and_convert, obtaining_function, conversion_function)
+        else:
+            self._obtain = obtaining_function
+        self._thunk: Callable[[], Any] = self._get_cached_value if self.ttl_seconds > 0 else self._obtain
+        _instances[id(self)] = self
+
+    def _get_cached_value(self) -> Any:
+        """Get the actual value, reusing the last one if it was obtained less than ttl_seconds ago."""
+        if time.monotonic() - self._cached_at < self.ttl_seconds:
+            return self._cached_value
+        self._cached_value = self._obtain()
+        self._cached_at = time.monotonic()
+        return self._cached_value
+
+    def clear_cache(self) -> None:
+        """Forget any cached value, so the next access obtains it again."""
+        self._cached_value = None
+        self._cached_at = -math.inf
 
     def __eq__(self, other: object) -> bool:
         """Make it work for equality checks (api_key == "secret_value")."""
-        return self._get_value() == other
+        value = self._thunk()
+        # Identity first, as list and dict lookups do, so a cached value compared with itself is instant
+        return value is other or value == other
 
     def __str__(self) -> str:
         """Make it work in string contexts (str(api_key) or print(api_key))."""
-        return str(self._get_value())
+        return str(self._thunk())
 
     def __repr__(self) -> str:
         """Make it work in repr contexts (repr(api_key))."""
-        return repr(self._get_value())
+        return repr(self._thunk())
 
     def __call__(self) -> Any:
         """Make it callable if wanted (api_key())."""
-        return self._get_value()
+        return self._thunk()
+
+    def __hash__(self) -> int:
+        """Make it hash like its value, which __eq__ compares it as (cache[api_key])."""
+        return hash(self._thunk())
+
+    def __bool__(self) -> bool:
+        """Make it work in truth tests (if api_key:)."""
+        return bool(self._thunk())
+
+    def __format__(self, format_spec: str) -> str:
+        """Make it work in formatting contexts (f"{port:>5}")."""
+        return format(self._thunk(), format_spec)
+
+    def __index__(self) -> int:
+        """Make it work where an integer is required (items[index] or range(count))."""
+        return operator.index(self._thunk())
+
+    def __int__(self) -> int:
+        """Make it work in integer conversions (int(port))."""
+        return int(self._thunk())
+
+    def __float__(self) -> float:
+        """Make it work in float conversions (float(rate))."""
+        return float(self._thunk())
+
+    def __len__(self) -> int:
+        """Make it work with len (len(api_key))."""
+        return len(self._thunk())
+
+    def __iter__(self) -> Iterator[Any]:
+        """Make it iterable (for host in hosts)."""
+        return iter(self._thunk())
+
+    def __contains__(self, item: object) -> bool:
+        """Make it work in membership tests ("admin" in roles)."""
+        return item in self._thunk()
+
+
+def clear_cached_values() -> None:
+    """Forget the cached value of every pseudo variable, e.g. after rotating a secret."""
+    for pseudo_variable in list(_instances.values()):
+        pseudo_variable.clear_cache()
@@ -2,37 +2,74 @@
 
 from __future__ import annotations
 
-import inspect
+import os
+import sys
 from collections.abc import Callable
-from types import ModuleType
+from functools import cache
+from types import FrameType, ModuleType
 from typing import Any
 
-from pydantic import validate_call
+from dotenv import dotenv_values, find_dotenv
 
 import sfs_settings
 from sfs_settings.exceptions import SettingsValidationError
 
 
-@validate_call
+@cache
+def dotenv_values_once() -> dict[str, str | None]:
+    """Load the .env file into os.environ, the first time any environment variable is read."""
+    # Searched for from the working directory, where the application using sfs_settings keeps its .env
+    values = dotenv_values(find_dotenv(usecwd=True))
+    # Like load_dotenv(), only add missing keys so the real environment takes precedence over the file
+    for key, value in values.items():
+        if value is not None and key not in os.environ:
+            os.environ[key] = value
+    # Also returned, so keys dropped when code restores a saved os.environ can still be found
+    return values
+
+
+def always_valid(_value: Any) -> bool:
+    """Accept every value.  The shared default validator_function."""
+    return True
+
+
 def obtain_convert_and_validate(
-    *,
     obtaining_function: Callable[[], str],
     conversion_function: Callable[[str], Any] | type,
-    is_valid_function: Callable[[Any], bool] = lambda _: True,
+    is_valid_function: Callable[[Any], bool] = always_valid,
 ) -> Any:
     """Obtain, convert, and validate a value."""
     value = obtaining_function()
-    converted_value = conversion_function(value) if value is not None else None
+    # Obtained values are already strings, so calling the default str conversion would change nothing
+    converted_value = value if conversion_function is str or value is None else conversion_function(value)
     if not is_valid_function(converted_value):
         raise SettingsValidationError
     return converted_value
 
 
-def get_calling_module() -> ModuleType:
-    """Get the module that called the function.  Kinda hacky."""
-    for frame in inspect.stack():
-        if not (set(frame.filename.split("/")) & {"sfs_settings", "pydantic"}):
-            return inspect.getmodule(frame.frame)  # type: ignore[return-value]
+def obtain_and_convert(
+    obtaining_function: Callable[[], str],
+    conversion_function: Callable[[str], Any] | type,
+) -> Any:
+    """Obtain and convert a value, for when the validator is `always_valid` and can't reject it."""
+    value = obtaining_function()
+    return conversion_function(value) if value is not None else None
+
+
+# Frames from files under these directories belong to sfs_settings or pydantic rather than to the caller
+SKIPPED_PATH_FRAGMENTS = (f"{os.sep}sfs_settings{os.sep}", f"{os.sep}pydantic{os.sep}")
+
+
+def get_calling_namespace() -> dict[str, Any]:
+    """Get the globals of the module that called into sfs_settings.  Kinda hacky."""
+    # Walking f_back is a pointer chase; inspect.stack() would read source files for every frame
+    frame: FrameType | None = sys._getframe(1)  # noqa: SLF001
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not any(fragment in filename for fragment in SKIPPED_PATH_FRAGMENTS):
+            # Only the module's globals are needed, so no frame outlives this call
+            return frame.f_globals
+        frame = frame.f_back
     raise ValueError(  # pragma: no cover
         "Could not find calling module.  This should be impossible.  Unreachable statement reached."
     )
@@ -122,3 +122,86 @@ def test_secret_rotation() -> None:
         new_key = ROTATING_KEY()  # type: ignore[name-defined, attr-defined]
     assert old_key == "old_secret"
     assert new_key == "new_secret"
+
+
+def test_secret_ttl_cache() -> None:
+    """Test that a ttl reuses the obtained secret until the cache is cleared."""
+    global STORE_NAME, KEY_NAME
+
+    temp_key = return_secret_var(STORE_NAME, KEY_NAME, ttl_seconds=60)
+    with patch("keyring.get_password", return_value="old_secret"):
+        assert temp_key() == "old_secret"
+
+    with patch("keyring.get_password", return_value="new_secret"):
+        assert temp_key() == "old_secret"
+        sfs.clear_cached_values()
+        assert temp_key() == "new_secret"
+
+
+def test_secret_no_ttl_reobtains() -> None:
+    """Test that a ttl of None keeps obtaining the secret on every use."""
+    global STORE_NAME, KEY_NAME
+
+    temp_key = return_secret_var(STORE_NAME, KEY_NAME, ttl_seconds=None)
+    with patch("keyring.get_password", return_value="old_secret"):
+        assert temp_key() == "old_secret"
+
+    with patch("keyring.get_password", return_value="new_secret"):
+        assert temp_key() == "new_secret"
+
+
+def test_secret_lookup_cache() -> None:
+    """Test that cache=True fetches the secret once until the secret cache is cleared."""
+    global STORE_NAME
+
+    temp_key = return_secret_var(STORE_NAME, "cached_key", cache=True)
+    with patch("keyring.get_password", return_value="old_secret") as get_password:
+        assert temp_key() == "old_secret"
+        assert temp_key() == "old_secret"
+        assert get_password.call_count == 1
+
+    with patch("keyring.get_password", return_value="new_secret"):
+        assert temp_key() == "old_secret"
+        sfs.clear_secret_cache()
+        assert temp_key() == "new_secret"
+    sfs.clear_secret_cache()
+
+
+@patch("keyring.get_password", fake)
+def test_bulk_track_secrets() -> None:
+    """Test tracking secrets alongside environment variables with a single call."""
+    global SECRET, STORE_NAME, KEY_NAME
+
+    sfs.bulk_track(
+        {
+            "BULK_SECRET": sfs.TrackSpec(store_name=STORE_NAME, name_in_store=KEY_NAME),
+            "BULK_LAZY_SECRET": sfs.TrackSpec(store_name=STORE_NAME, reobtain_each_usage=True),
+        }
+    )
+    assert sfs.BULK_SECRET == SECRET  # type: ignore[attr-defined]
+    assert sfs.BULK_LAZY_SECRET == SECRET  # type: ignore[attr-defined]
+
+
+def test_secret_cache_size() -> None:
+    """Test that cache=1 only keeps the latest secret, while cache=True, which equals 1, keeps several."""
+    global STORE_NAME
+
+    sfs.clear_secret_cache()
+    for cache, expected_fetches in ((1, 3), (True, 2)):
+        first = return_secret_var(STORE_NAME, "first_sized_key", cache=cache)
+        second = return_secret_var(STORE_NAME, "second_sized_key", cache=cache)
+        with patch("keyring.get_password", return_value="secret") as get_password:
+            first()
+            second()
+            first()
+        assert get_password.call_count == expected_fetches, f"cache={cache!r}"
+        sfs.clear_secret_cache()
+
+
+@pytest.mark.parametrize("cache", [0, -1])
+def test_secret_cache_size_must_be_positive(cache: int) -> None:
+    """Test that a cache size below 1 is rejected instead of silently disabling the cache."""
+    global STORE_NAME, KEY_NAME
+
+    with pytest.raises(ValueError):
+        return_secret_var(STORE_NAME, KEY_NAME, cache=cache)
@@ -5,10 +5,13 @@ import os
 import random
 import string
 import sys  # Add missing import
+from collections.abc import Iterator
+from pathlib import Path
 from typing import Any
 from unittest.mock import patch
 
 import pytest
+from pydantic import ValidationError
 
 import sfs_settings as sfs
 from sfs_settings.core_functions import (
@@ -17,6 +20,7 @@ from sfs_settings.core_functions import (
     track_env_var,
 )
 from sfs_settings.exceptions import SettingsNotFoundError
+from sfs_settings.utility_functions import dotenv_values_once
 
 
 class TestEnvironmentVariables:
@@ -123,3 +127,92 @@ def test_env_get_lazy_returned() -> None:
     global RAND_VAL
     temp_key = return_env_var("TEMP_KEY")
     assert temp_key == RAND_VAL, f"TEMP_KEY is not set to {RAND_VAL}, but is set to {temp_key!s}"
+
+
+def test_lazy_value_protocols() -> None:
+    """Test that a lazy value behaves like the value it obtains in common operations."""
+    port = return_env_var("LAZY_PORT", conversion_function=int, reobtain_each_usage=True)
+    index = return_env_var("LAZY_INDEX", conversion_function=int, reobtain_each_usage=True)
+    hosts = return_env_var("LAZY_HOSTS", conversion_function=str.split, reobtain_each_usage=True)
+    with patch.dict(os.environ, {"LAZY_PORT": "8080", "LAZY_INDEX": "1", "LAZY_HOSTS": "a b"}):
+        assert port
+        assert f"{port:>6}" == "  8080"
+        assert hash(port) == hash(8080)
+        assert int(port) == 8080
+        assert float(port) == 8080.0
+        assert ["a", "b", "c"][index] == "b"
+        assert len(hosts) == 2
+        assert list(hosts) == ["a", "b"]
+        assert "a" in hosts
+
+
+def test_bulk_track() -> None:
+    """Test tracking several environment variables with a single call."""
+    with patch.dict(os.environ, {"BULK_NUMBER": "42", "BULK_TEXT": "text"}):
+        sfs.bulk_track(
+            {
+                "BULK_NUMBER": sfs.TrackSpec(conversion_function=int),
+                "BULK_TEXT": sfs.TrackSpec(reobtain_each_usage=True),
+                "BULK_DEFAULTED": sfs.TrackSpec(default="fallback"),
+            }
+        )
+        assert sfs.BULK_NUMBER == 42  # type: ignore[attr-defined]
+        assert sfs.BULK_TEXT == "text"  # type: ignore[attr-defined]
+        assert sfs.BULK_DEFAULTED == "fallback"  # type: ignore[attr-defined]
+
+
+def test_bulk_track_rejects_unknown_options() -> None:
+    """Test that a misspelled option is reported instead of silently ignored."""
+    with pytest.raises(ValidationError):
+        sfs.bulk_track({"BULK_TYPO": {"defualt": "fallback"}})  # type: ignore[dict-item]
+    assert "BULK_TYPO" not in vars(sfs)
+
+
+def test_bulk_track_in_caller() -> None:
+    """Test that bulk tracking with where="caller" sets the variables in this test module."""
+    with patch.dict(os.environ, {"BULK_LOCAL": "local"}):
+        sfs.bulk_track({"BULK_LOCAL": sfs.TrackSpec()}, where="caller")
+
+    assert globals()["BULK_LOCAL"] == "local"
+    assert "BULK_LOCAL" not in vars(sfs)
+
+
+def test_local_var_set_in_calling_module() -> None:
+    """Test that the caller found through pydantic's and sfs_settings' frames is this test module."""
+    with patch.dict(os.environ, {"CALLER_CHECK": "here"}):
+        set_env_var_locally("CALLER_CHECK")
+
+    assert globals()["CALLER_CHECK"] == "here"
+    for module_name, module in list(sys.modules.items()):
+        if module_name.startswith(("pydantic", "sfs_settings")):
+            assert "CALLER_CHECK" not in vars(module), f"CALLER_CHECK was set in {module_name}"
+
+
+@pytest.fixture
+def dotenv_in_cwd(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Run the test from a directory holding a .env file, reading it afresh."""
+    (tmp_path / ".env").write_text("FOO_DOTENV=from_file\nOTHER_DOTENV=from_file\n")
+    monkeypatch.chdir(tmp_path)
+    dotenv_values_once.cache_clear()
+    yield
+    dotenv_values_once.cache_clear()
+    for key in ("FOO_DOTENV", "OTHER_DOTENV"):
+        os.environ.pop(key, None)
+
+
+@pytest.mark.usefixtures("dotenv_in_cwd")
+def test_dotenv_loaded_into_environ() -> None:
+    """Test that the first env read adds missing .env keys to os.environ, without overriding set ones."""
+    with patch.dict(os.environ, {"OTHER_DOTENV": "from_environ"}):
+        assert return_env_var("OTHER_DOTENV") == "from_environ"
+        assert os.environ["FOO_DOTENV"] == "from_file"
+        assert os.environ["OTHER_DOTENV"] == "from_environ"
+
+
+@pytest.mark.usefixtures("dotenv_in_cwd")
+def test_dotenv_survives_environ_restore() -> None:
+    """Test that .env values stay readable after the first read happened inside a restored os.environ."""
+    with patch.dict(os.environ, {"OTHER_DOTENV": "from_environ"}):
+        assert return_env_var("OTHER_DOTENV") == "from_environ"
+    assert "FOO_DOTENV" not in os.environ
+    assert return_env_var("FOO_DOTENV") == "from_file"